@@ -1,11 +1,15 @@
 """Settings persistence for Claude Tracker."""
 
 import json
+import logging
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
 
+log = logging.getLogger(__name__)
+
 SETTINGS_PATH = Path.home() / ".claude" / "tracker-settings.json"
+POPUP_RENDERERS = ("widgets", "image")
 
 
 @dataclass
@@ -13,6 +17,14 @@ class Settings:
     refresh_interval: int = 60  # seconds (1 minute)
     start_on_boot: bool = False
     theme: str = "dark"
+    popup_renderer: str = "widgets"  # "widgets" or "image" (single Pillow canvas)
+    lite_mode: bool = False  # tray menu only, no customtkinter until Settings is opened
+    cap_forecast: bool | None = None  # 7-day cap forecast (loads NumPy); None = off in lite mode only
+    tray_icon_subkey: str = ""  # cached NotifyIconSettings entry for auto-pin
+
+    def forecast_enabled(self, lite: bool = False) -> bool:
+        """``cap_forecast`` if set explicitly, else on except in lite mode."""
+        return (not lite) if self.cap_forecast is None else self.cap_forecast
 
     def save(self) -> None:
         SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -28,6 +40,11 @@ class Settings:
             data = json.loads(SETTINGS_PATH.read_text(encoding="utf-8"))
             known_fields = {f.name for f in cls.__dataclass_fields__.values()}
             filtered = {k: v for k, v in data.items() if k in known_fields}
-            return cls(**filtered)
+            settings = cls(**filtered)
         except (json.JSONDecodeError, TypeError):
             return cls()
+        if settings.popup_renderer not in POPUP_RENDERERS:
+            log.warning("Unknown popup_renderer %r, using %r",
+                        settings.popup_renderer, POPUP_RENDERERS[0])
+            settings.popup_renderer = POPUP_RENDERERS[0]
+        return settings
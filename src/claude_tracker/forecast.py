@@ -0,0 +1,230 @@
+"""Long-horizon 7-day quota simulator.
+
+Usage samples recorded from the poll loop are binned into an hour-of-week
+consumption profile (percent of the 7-day quota used per hour, one row per
+past week). Each Monte Carlo path picks one past week at random and replays
+it hour by hour, from the current hour-of-week until ``seven_day.resets_at``
+(running on into the following week if the horizon wraps), to estimate
+whether and when the weekly cap is hit. Replaying whole weeks keeps heavy and
+light weeks apart instead of averaging them out hour by hour.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from claude_tracker.api import UsageBucket, UsageData
+
+log = logging.getLogger(__name__)
+
+HISTORY_PATH = Path.home() / ".claude" / "tracker-history.bin"
+
+SAMPLE_DTYPE = np.dtype([("t", "<f8"), ("util", "<f4"), ("resets", "<f8")])
+HISTORY_WEEKS = 53  # samples kept on disk
+PROFILE_WEEKS = 12  # recent weeks the profile is fitted on
+MAX_GAP = 2 * 3600  # seconds; longer gaps between samples are not attributed
+MIN_COVERAGE = 600  # seconds of samples needed for an hour to count as observed
+MIN_OBSERVED_HOURS = 24
+REFIT_INTERVAL = 3600
+TRIM_INTERVAL = 86400  # how often samples older than HISTORY_WEEKS are dropped
+PATHS = 4000
+
+HOUR = 3600
+WEEK_HOURS = 168
+EPOCH_MONDAY_OFFSET = 72  # 1970-01-01 was a Thursday; shift so Monday 00:00 is hour 0
+
+
+@dataclass
+class CapForecast:
+    probability: float  # 0-1, chance of reaching 100% before reset
+    likely_cap_at: datetime | None  # median cap time over the paths that cap
+
+    @property
+    def summary(self) -> str:
+        if self.probability < 0.01:
+            return "7D cap risk <1%"
+        text = f"7D cap risk {self.probability:.0%}"
+        if self.likely_cap_at:
+            text += f" · likely {self.likely_cap_at.astimezone():%a %H:%M}"
+        return text
+
+
+def _utc_offset() -> float:
+    return time.localtime().tm_gmtoff
+
+
+def _local_hours(t: np.ndarray | float, utc_offset: float) -> np.ndarray:
+    """Absolute local hour index, aligned so that ``% 168`` is hour-of-week."""
+    return np.floor_divide(np.asarray(t) + utc_offset, HOUR).astype(np.int64) + EPOCH_MONDAY_OFFSET
+
+
+def fit_profile(samples: np.ndarray, utc_offset: float = 0.0) -> np.ndarray | None:
+    """Per-week, per-hour-of-week consumption rates in percent per hour.
+
+    Returns a ``(weeks, 168)`` array with unobserved hours filled from the
+    mean of the same hour in other weeks, or ``None`` if there is too little
+    data to say anything.
+    """
+    if len(samples) < 2:
+        return None
+    t = samples["t"]
+    util = samples["util"].astype(np.float64)
+    resets = samples["resets"]
+
+    dt = np.diff(t)
+    du = np.diff(util)
+    # Same 7-day window (resets_at may jitter slightly between polls) and no
+    # long gap; drops below zero are resets, not negative usage.
+    ok = (dt > 0) & (dt <= MAX_GAP) & (np.abs(np.diff(resets)) < HOUR) & (resets[1:] > 0)
+    if not ok.any():
+        return None
+
+    hours = _local_hours(t[:-1][ok], utc_offset)
+    first_week = hours.min() // WEEK_HOURS
+    cells = hours - first_week * WEEK_HOURS
+    n_cells = (cells.max() // WEEK_HOURS + 1) * WEEK_HOURS
+
+    consumed = np.bincount(cells, weights=np.clip(du[ok], 0.0, None), minlength=n_cells)
+    covered = np.bincount(cells, weights=dt[ok], minlength=n_cells)
+    observed = covered >= MIN_COVERAGE
+    if observed.sum() < MIN_OBSERVED_HOURS:
+        return None
+
+    rates = np.full(n_cells, np.nan)
+    rates[observed] = consumed[observed] / covered[observed] * HOUR
+    rates = rates.reshape(-1, WEEK_HOURS)
+
+    seen = ~np.isnan(rates)
+    counts = seen.sum(axis=0)
+    hour_mean = np.where(counts > 0, np.nansum(rates, axis=0) / np.maximum(counts, 1), 0.0)
+    return np.where(seen, rates, hour_mean)
+
+
+def simulate(
+    profile: np.ndarray,
+    current: float,
+    now: float,
+    resets_at: float,
+    utc_offset: float = 0.0,
+    paths: int = PATHS,
+    rng: np.random.Generator | None = None,
+) -> CapForecast:
+    """Monte Carlo projection of 7-day utilization from ``now`` to ``resets_at``."""
+    if current >= 100:
+        return CapForecast(1.0, datetime.fromtimestamp(now, timezone.utc))
+    horizon = min(int(np.ceil((resets_at - now) / HOUR)), WEEK_HOURS)
+    if horizon <= 0:
+        return CapForecast(0.0, None)
+
+    rng = rng or np.random.default_rng()
+    # One past week per path, entered at the current hour-of-week; the
+    # flattened profile lets a path run on into the next week (or wrap to
+    # the first) when the horizon crosses Monday 00:00.
+    timeline = profile.ravel()
+    start = rng.integers(0, profile.shape[0], size=(paths, 1)) * WEEK_HOURS
+    offsets = _local_hours(now, utc_offset) % WEEK_HOURS + np.arange(horizon)
+    projected = current + np.cumsum(timeline[(start + offsets) % timeline.size], axis=1)
+
+    hit = projected >= 100
+    capped = hit.any(axis=1)
+    probability = float(capped.mean())
+    if not capped.any():
+        return CapForecast(probability, None)
+    first_hour = np.median(hit[capped].argmax(axis=1)) + 1
+    cap_at = min(now + first_hour * HOUR, resets_at)
+    return CapForecast(probability, datetime.fromtimestamp(cap_at, timezone.utc))
+
+
+class UsageHistory:
+    """Append-only store of 7-day usage samples, mirrored to ``path``."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or HISTORY_PATH
+        self._samples = np.empty(0, dtype=SAMPLE_DTYPE)
+        self._count = 0
+        self._profile: np.ndarray | None = None
+        self._fitted_at = 0.0
+        self._trimmed_at = time.time()
+        self._load()
+
+    @property
+    def samples(self) -> np.ndarray:
+        return self._samples[: self._count]
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            raw = self.path.read_bytes()
+        except OSError as e:
+            log.warning("Could not read usage history: %s", e)
+            return
+        usable = len(raw) - len(raw) % SAMPLE_DTYPE.itemsize
+        self._samples = np.frombuffer(raw[:usable], dtype=SAMPLE_DTYPE).copy()
+        self._count = len(self._samples)
+        if not self._trim(time.time()) and usable != len(raw):
+            self._rewrite()
+
+    def _trim(self, now: float) -> bool:
+        """Drop samples older than HISTORY_WEEKS, in memory and on disk."""
+        self._trimmed_at = now
+        cutoff = now - HISTORY_WEEKS * WEEK_HOURS * HOUR
+        start = int(np.searchsorted(self.samples["t"], cutoff))
+        if not start:
+            return False
+        kept = self._count - start
+        self._samples[:kept] = self._samples[start : self._count]
+        self._count = kept
+        self._rewrite()
+        return True
+
+    def _rewrite(self) -> None:
+        try:
+            self.path.write_bytes(self.samples.tobytes())
+        except OSError as e:
+            log.warning("Could not trim usage history: %s", e)
+
+    def record(self, usage: UsageData, now: float | None = None) -> None:
+        if usage.error:
+            return
+        bucket = usage.seven_day
+        sample = np.zeros(1, dtype=SAMPLE_DTYPE)
+        now = time.time() if now is None else now
+        sample["t"] = now
+        sample["util"] = bucket.utilization
+        sample["resets"] = bucket.resets_at.timestamp() if bucket.resets_at else 0.0
+
+        if self._count == len(self._samples) or now - self._trimmed_at >= TRIM_INTERVAL:
+            self._trim(now)
+        if self._count == len(self._samples):
+            grown = np.empty(max(1024, 2 * len(self._samples)), dtype=SAMPLE_DTYPE)
+            grown[: self._count] = self._samples[: self._count]
+            self._samples = grown
+        self._samples[self._count] = sample[0]
+        self._count += 1
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("ab") as f:
+                f.write(sample.tobytes())
+        except OSError as e:
+            log.warning("Could not save usage sample: %s", e)
+
+    def forecast(self, bucket: UsageBucket, now: float | None = None) -> CapForecast | None:
+        """Cap forecast for the 7-day bucket, refitting the profile at most hourly."""
+        if not bucket.resets_at:
+            return None
+        now = time.time() if now is None else now
+        utc_offset = _utc_offset()
+        if self._profile is None or now - self._fitted_at >= REFIT_INTERVAL:
+            samples = self.samples
+            start = int(np.searchsorted(samples["t"], now - PROFILE_WEEKS * WEEK_HOURS * HOUR))
+            self._profile = fit_profile(samples[start:], utc_offset)
+            self._fitted_at = now
+        if self._profile is None:
+            return None
+        return simulate(self._profile, bucket.utilization, now, bucket.resets_at.timestamp(), utc_offset)
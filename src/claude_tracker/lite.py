@@ -0,0 +1,201 @@
+"""Low-memory "lite" mode driven only by pystray.
+
+No Tk interpreter or customtkinter is ever loaded in this process: usage
+details are shown as dynamic tray menu items, polling runs on a worker
+thread, and the customtkinter Settings dialog runs in a short-lived child
+process (``--settings``) whose saved settings are reloaded when it exits.
+"""
+
+import logging
+import subprocess
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+import pystray
+
+from claude_tracker.api import UsageBucket, UsageData, fetch_usage
+from claude_tracker.config import Settings
+from claude_tracker.tray import TRAY_TOOLTIP, StartupTimer, _create_split_icon, _promote_tray_icon
+
+if TYPE_CHECKING:
+    from claude_tracker.forecast import CapForecast, UsageHistory
+
+log = logging.getLogger(__name__)
+
+BAR_WIDTH = 10
+
+
+def _text_bar(util: float) -> str:
+    filled = round(min(max(util, 0.0), 100.0) / 100.0 * BAR_WIDTH)
+    return "█" * filled + "░" * (BAR_WIDTH - filled)
+
+
+def _settings_command() -> list[str]:
+    if getattr(sys, "frozen", False):
+        return [sys.executable, "--settings"]
+    return [sys.executable, "-m", "claude_tracker", "--settings"]
+
+
+def _bucket_line(label: str, bucket: UsageBucket) -> str:
+    line = f"{label}  {_text_bar(bucket.utilization)}  {bucket.utilization:.0f}%"
+    if bucket.time_until_reset:
+        line += f"  ·  resets {bucket.time_until_reset}"
+    return line
+
+
+class LiteTracker:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+        self._last_usage: UsageData | None = None
+        self._history: "UsageHistory | None" = None  # NumPy is loaded on the first successful poll
+        self._forecast: "CapForecast | None" = None
+        self._icon: pystray.Icon | None = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._settings_open = threading.Lock()
+        self._reload_settings = False
+        self._tray_subkey: str | None = None  # found by auto-pin, saved by the poll worker
+        self.startup: StartupTimer | None = None
+
+    # ── Menu ─────────────────────────────────────────────────────
+
+    def _menu(self) -> pystray.Menu:
+        return pystray.Menu(
+            pystray.MenuItem("Claude Code Usage", None, enabled=False),
+            pystray.MenuItem(lambda _: self._usage_line("5H"), None, enabled=False),
+            pystray.MenuItem(lambda _: self._usage_line("7D"), None, enabled=False),
+            pystray.MenuItem(lambda _: self._forecast.summary if self._forecast else "",
+                             None, enabled=False, visible=lambda _: self._forecast is not None),
+            pystray.MenuItem(lambda _: self._last_usage.error if self._last_usage else "",
+                             None, enabled=False,
+                             visible=lambda _: bool(self._last_usage and self._last_usage.error)),
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem("Refresh", self._on_refresh, default=True),
+            pystray.MenuItem("Settings", self._on_settings),
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem("Exit", self._on_exit),
+        )
+
+    def _usage_line(self, label: str) -> str:
+        usage = self._last_usage
+        if usage is None:
+            return f"{label}  loading..."
+        bucket = usage.five_hour if label == "5H" else usage.seven_day
+        return _bucket_line(label, bucket)
+
+    # ── Polling ──────────────────────────────────────────────────
+
+    def refresh(self) -> None:
+        log.info("Refreshing usage data...")
+        self._apply_usage(fetch_usage())
+
+    def _apply_usage(self, usage: UsageData) -> None:
+        self._last_usage = usage
+        if not usage.error and self.settings.forecast_enabled(lite=True):
+            self._update_forecast(usage)
+        if self._icon:
+            self._icon.icon = _create_split_icon(usage.five_hour.utilization, usage.seven_day.utilization)
+            self._icon.title = (
+                f"Claude: 5H {usage.five_hour.utilization:.0f}%  |  7D {usage.seven_day.utilization:.0f}%"
+            )
+            self._icon.update_menu()
+        if self.startup:
+            self.startup.mark("poll")
+
+    def _update_forecast(self, usage: UsageData) -> None:
+        if self._history is None:
+            from claude_tracker.forecast import UsageHistory
+
+            self._history = UsageHistory()
+        self._history.record(usage)
+        self._forecast = self._history.forecast(usage.seven_day)
+
+    def _poll_loop(self) -> None:
+        while not self._stop.is_set():
+            self._sync_settings()
+            try:
+                self.refresh()
+            except Exception:
+                log.exception("Poll failed")
+            self._wake.wait(self.settings.refresh_interval)
+            self._wake.clear()
+
+    def _sync_settings(self) -> None:
+        """Reload and save settings on the poll worker, the only thread that touches them."""
+        if self._reload_settings:
+            self._reload_settings = False
+            self.settings = Settings.load()
+        subkey = self._tray_subkey
+        # While the Settings child is open it owns the file; save once it closes
+        if subkey is not None and not self._settings_open.locked():
+            self._tray_subkey = None
+            if subkey != self.settings.tray_icon_subkey:
+                self.settings.tray_icon_subkey = subkey
+                self.settings.save()
+
+    def remember_tray_subkey(self, subkey: str) -> None:
+        self._tray_subkey = subkey
+
+    def start_polling(self) -> None:
+        """Start the worker, or poll now and pick up a changed interval."""
+        if self._thread and self._thread.is_alive():
+            self._wake.set()
+            return
+        self._thread = threading.Thread(target=self._poll_loop, daemon=True)
+        self._thread.start()
+
+    # ── Settings (child process) ─────────────────────────────────
+
+    def open_settings(self) -> None:
+        if not self._settings_open.acquire(blocking=False):
+            return
+        threading.Thread(target=self._run_settings, daemon=True).start()
+
+    def _run_settings(self) -> None:
+        try:
+            subprocess.run(_settings_command(), check=False,
+                           creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+            self._reload_settings = True
+            self._wake.set()  # reload, poll now and pick up the new interval
+        except OSError as e:
+            log.error("Could not open settings: %s", e)
+        finally:
+            self._settings_open.release()
+
+    # ── Tray callbacks ───────────────────────────────────────────
+
+    def _on_refresh(self, icon: pystray.Icon, item: pystray.MenuItem) -> None:
+        self._wake.set()
+
+    def _on_settings(self, icon: pystray.Icon, item: pystray.MenuItem) -> None:
+        self.open_settings()
+
+    def _on_exit(self, icon: pystray.Icon, item: pystray.MenuItem) -> None:
+        self.quit_app()
+
+    def quit_app(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._icon:
+            self._icon.stop()
+
+    def run(self) -> None:
+        self._icon = pystray.Icon(
+            "claude_tracker",
+            icon=_create_split_icon(),
+            title=TRAY_TOOLTIP,
+            menu=self._menu(),
+        )
+        threading.Timer(2.0, _promote_tray_icon, kwargs={
+            "cached": self.settings.tray_icon_subkey,
+            "on_match": self.remember_tray_subkey,
+        }).start()
+        self.start_polling()
+        self._icon.run(setup=self._on_icon_ready)
+
+    def _on_icon_ready(self, icon: pystray.Icon) -> None:
+        icon.visible = True
+        if self.startup:
+            self.startup.mark("icon")
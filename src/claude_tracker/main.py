@@ -20,23 +20,60 @@ def _setup_logging() -> None:
     )
 
 
+def _print_usage() -> None:
+    """Fetch usage once and print it, recording it for the 7-day cap forecast if enabled."""
+    from claude_tracker.api import fetch_usage
+    from claude_tracker.config import Settings
+
+    usage = fetch_usage()
+    if usage.error:
+        print(usage.error)
+        sys.exit(1)
+    for label, bucket in [("5H", usage.five_hour), ("7D", usage.seven_day)]:
+        line = f"{label}  {bucket.utilization:3.0f}%"
+        if bucket.time_until_reset:
+            line += f"  resets {bucket.time_until_reset}"
+        print(line)
+
+    if not Settings.load().forecast_enabled():
+        return
+
+    from claude_tracker.forecast import UsageHistory  # pulls in NumPy
+
+    history = UsageHistory()
+    history.record(usage)
+    forecast = history.forecast(usage.seven_day)
+    print(forecast.summary if forecast else "7D cap risk: not enough history yet")
+
+
 def main() -> None:
     _setup_logging()
     log = logging.getLogger(__name__)
 
     is_autostart = "--startup" in sys.argv
 
+    if "--headless" in sys.argv:
+        _print_usage()
+        return
+
+    if "--settings" in sys.argv:
+        # Settings window on its own, spawned by lite mode
+        from claude_tracker.widget import run_settings_dialog
+
+        run_settings_dialog()
+        return
+
     try:
         if is_autostart:
             log.info("Auto-start mode — waiting for desktop to be ready...")
             time.sleep(5)
 
         log.info("Starting Claude Tracker...")
+        started = time.perf_counter()
 
         from claude_tracker.config import Settings
         from claude_tracker.startup import is_startup_enabled, set_startup
-        from claude_tracker.tray import TrayManager
-        from claude_tracker.widget import TrackerWidget
+        from claude_tracker.tray import StartupTimer
 
         settings = Settings.load()
 
@@ -46,9 +83,22 @@ def main() -> None:
             log.info("Restoring missing startup registry entry")
             set_startup(True)
 
+        if "--lite" in sys.argv or settings.lite_mode:
+            # pystray only — customtkinter loads lazily if Settings is opened
+            from claude_tracker.lite import LiteTracker
+
+            lite = LiteTracker(settings)
+            lite.startup = StartupTimer("Lite", started)
+            lite.run()
+            return
+
+        from claude_tracker.tray import TrayManager
+        from claude_tracker.widget import TrackerWidget
+
         widget = TrackerWidget(settings)
         tray = TrayManager(widget)
         widget.set_tray(tray)
+        widget.startup = tray.startup = StartupTimer("Default", started)
 
         tray.start()
         widget.start_polling()
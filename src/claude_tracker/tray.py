@@ -3,8 +3,10 @@
 import logging
 import os
 import threading
+import time
 import winreg
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Protocol
 
 import pystray
 from PIL import Image, ImageDraw, ImageFont
@@ -76,61 +78,140 @@ def _create_split_icon(
     return img
 
 
-def _promote_tray_icon() -> bool:
-    """Try to auto-pin (promote) our tray icon so it's always visible."""
-    try:
-        exe_path = os.path.abspath(os.sys.executable).lower()
-        key_path = r"Control Panel\NotifyIconSettings"
-        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path)
+NOTIFY_ICON_KEY = r"Control Panel\NotifyIconSettings"
+TRAY_TOOLTIP = "Claude Tracker"
 
-        promoted = False
-        i = 0
-        while True:
-            try:
-                subkey_name = winreg.EnumKey(key, i)
-                i += 1
-            except OSError:
-                break
-            try:
-                subkey = winreg.OpenKey(key, subkey_name, access=winreg.KEY_READ | winreg.KEY_SET_VALUE)
+
+class NotifyIconStore(Protocol):
+    """Access to the per-icon subkeys under NotifyIconSettings."""
+
+    def subkeys(self) -> Iterator[str]: ...
+
+    def read(self, subkey: str, *names: str) -> dict[str, object]:
+        """Return the requested values that exist; ``{}`` if the subkey is gone."""
+        ...
+
+    def write_dword(self, subkey: str, name: str, value: int) -> None: ...
+
+
+class WinRegNotifyIconStore:
+    def subkeys(self) -> Iterator[str]:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, NOTIFY_ICON_KEY) as key:
+            i = 0
+            while True:
                 try:
-                    tooltip = ""
-                    try:
-                        tooltip, _ = winreg.QueryValueEx(subkey, "InitialTooltip")
-                    except FileNotFoundError:
-                        pass
+                    yield winreg.EnumKey(key, i)
+                except OSError:
+                    return
+                i += 1
 
-                    path_val = ""
+    def read(self, subkey: str, *names: str) -> dict[str, object]:
+        values: dict[str, object] = {}
+        try:
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, rf"{NOTIFY_ICON_KEY}\{subkey}") as key:
+                for name in names:
                     try:
-                        path_val, _ = winreg.QueryValueEx(subkey, "ExecutablePath")
+                        values[name], _ = winreg.QueryValueEx(key, name)
                     except FileNotFoundError:
                         pass
+        except OSError:
+            pass
+        return values
+
+    def write_dword(self, subkey: str, name: str, value: int) -> None:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, rf"{NOTIFY_ICON_KEY}\{subkey}",
+                            0, winreg.KEY_SET_VALUE) as key:
+            winreg.SetValueEx(key, name, 0, winreg.REG_DWORD, value)
+
+
+class MemoryNotifyIconStore:
+    """In-memory NotifyIconStore for exercising the promotion logic off Windows."""
 
-                    is_ours = (tooltip == "Claude Tracker" or
-                               (path_val and exe_path in path_val.lower()))
-
-                    if is_ours:
-                        try:
-                            current, _ = winreg.QueryValueEx(subkey, "IsPromoted")
-                            if current == 1:
-                                promoted = True
-                                continue
-                        except FileNotFoundError:
-                            pass
-                        winreg.SetValueEx(subkey, "IsPromoted", 0, winreg.REG_DWORD, 1)
-                        log.info("Promoted tray icon: %s", subkey_name)
-                        promoted = True
-                except Exception:
-                    pass
-                finally:
-                    winreg.CloseKey(subkey)
-            except OSError:
+    def __init__(self, entries: dict[str, dict[str, object]] | None = None) -> None:
+        self.entries = entries if entries is not None else {}
+        self.reads = 0
+        self.writes = 0
+
+    def subkeys(self) -> Iterator[str]:
+        yield from list(self.entries)
+
+    def read(self, subkey: str, *names: str) -> dict[str, object]:
+        self.reads += 1
+        values = self.entries.get(subkey, {})
+        return {name: values[name] for name in names if name in values}
+
+    def write_dword(self, subkey: str, name: str, value: int) -> None:
+        self.writes += 1
+        self.entries.setdefault(subkey, {})[name] = value
+
+
+def _is_our_icon(values: dict[str, object], exe_path: str, strict: bool = False) -> bool:
+    """Match by initial tooltip or executable path.
+
+    ``strict`` rejects entries whose path points at another executable, so a
+    cached subkey left behind by an old install is not mistaken for ours.
+    """
+    path_val = str(values.get("ExecutablePath") or "").lower()
+    if path_val:
+        if exe_path in path_val:
+            return True
+        if strict:
+            return False
+    return values.get("InitialTooltip") == TRAY_TOOLTIP
+
+
+def _promote_tray_icon(
+    store: NotifyIconStore | None = None,
+    cached: str = "",
+    on_match: Callable[[str], None] | None = None,
+    broadcast: Callable[[], None] | None = None,
+) -> bool:
+    """Try to auto-pin (promote) our tray icon so it's always visible.
+
+    ``cached`` is the subkey remembered from an earlier launch; it is tried
+    before scanning every NotifyIconSettings entry. When a scan finds a
+    different entry, ``on_match`` gets it — this runs on a Timer thread, so
+    the callback hands it to whichever thread owns the settings. The shell
+    is only notified when ``IsPromoted`` actually changed.
+    """
+    store = store or WinRegNotifyIconStore()
+    broadcast = broadcast or _restart_explorer_tray
+    fields = ("InitialTooltip", "ExecutablePath", "IsPromoted")
+    try:
+        exe_path = os.path.abspath(os.sys.executable).lower()
+
+        matches: dict[str, dict[str, object]] = {}
+        if cached:
+            values = store.read(cached, *fields)
+            if _is_our_icon(values, exe_path, strict=True):
+                matches[cached] = values
+        if not matches:
+            for subkey_name in store.subkeys():
+                values = store.read(subkey_name, *fields)
+                if _is_our_icon(values, exe_path):
+                    matches[subkey_name] = values
+            if on_match and matches:
+                # Prefer an entry for this executable over a tooltip-only match
+                best = next((k for k, v in matches.items() if _is_our_icon(v, exe_path, strict=True)),
+                            next(iter(matches)))
+                if best != cached:
+                    on_match(best)
+
+        changed = False
+        for subkey_name, values in matches.items():
+            if values.get("IsPromoted") == 1:
+                continue
+            try:
+                store.write_dword(subkey_name, "IsPromoted", 1)
+            except OSError as e:
+                log.warning("Could not promote tray icon %s: %s", subkey_name, e)
                 continue
+            log.info("Promoted tray icon: %s", subkey_name)
+            changed = True
 
-        winreg.CloseKey(key)
-        if promoted:
-            _restart_explorer_tray()
-        return promoted
+        if changed:
+            broadcast()
+        return bool(matches)
     except Exception as e:
         log.warning("Could not auto-promote tray icon: %s", e)
         return False
@@ -143,11 +224,36 @@ def _restart_explorer_tray() -> None:
     ctypes.windll.user32.SendMessageW(HWND_BROADCAST, WM_SETTINGCHANGE, 0, "TraySettings")
 
 
+class StartupTimer:
+    """Logs time-to-ready once the tray icon is up and the first poll applied.
+
+    Both run modes mark the same two steps, so their timings are comparable.
+    """
+
+    def __init__(self, mode: str, started: float) -> None:
+        self._mode = mode
+        self._started = started
+        self._pending = {"icon", "poll"}
+        self._lock = threading.Lock()
+        self.ready_ms: float | None = None
+
+    def mark(self, step: str) -> None:
+        with self._lock:
+            if not self._pending:
+                return
+            self._pending.discard(step)
+            if self._pending:
+                return
+            self.ready_ms = (time.perf_counter() - self._started) * 1000
+        log.info("%s mode ready in %.0f ms", self._mode, self.ready_ms)
+
+
 class TrayManager:
     def __init__(self, widget: "TrackerWidget") -> None:
         self._widget = widget
         self._icon: pystray.Icon | None = None
         self._thread: threading.Thread | None = None
+        self.startup: StartupTimer | None = None
 
     def start(self) -> None:
         self._thread = threading.Thread(target=self._run, daemon=True)
@@ -162,14 +268,24 @@ class TrayManager:
             pystray.Menu.SEPARATOR,
             pystray.MenuItem("Exit", self._on_exit),
         )
+        usage = self._widget._last_usage  # the first poll may beat the icon
         self._icon = pystray.Icon(
             "claude_tracker",
-            icon=_create_split_icon(),
-            title="Claude Tracker",
+            icon=_create_split_icon(usage.five_hour.utilization, usage.seven_day.utilization)
+            if usage else _create_split_icon(),
+            title=TRAY_TOOLTIP,
             menu=menu,
         )
-        threading.Timer(2.0, _promote_tray_icon).start()
-        self._icon.run()
+        threading.Timer(2.0, _promote_tray_icon, kwargs={
+            "cached": self._widget.settings.tray_icon_subkey,
+            "on_match": lambda subkey: self._widget.root.after(0, self._widget.remember_tray_subkey, subkey),
+        }).start()
+        self._icon.run(setup=self._on_icon_ready)
+
+    def _on_icon_ready(self, icon: pystray.Icon) -> None:
+        icon.visible = True
+        if self.startup:
+            self.startup.mark("icon")
 
     def update_icon(self, util_5h: float, util_7d: float) -> None:
         if self._icon:
@@ -0,0 +1,153 @@
+"""Main-thread stall watchdog.
+
+Everything user-facing runs on the Tk mainloop, so a slow poll, popup build
+or settings save freezes the whole app. The Tk loop heartbeats through
+``root.after``; a background thread notices when a heartbeat is late, grabs
+the main thread's stack via ``sys._current_frames`` and logs it. Finished
+stalls are kept in a bounded ring with their duration and stack.
+
+Lateness is measured on a clock that stops while the system sleeps
+(``QueryUnbiasedInterruptTime`` on Windows, where ``time.monotonic`` keeps
+counting; ``time.monotonic`` elsewhere), so a suspend doesn't look like a
+stall. As a second line of defence a late heartbeat only counts as a stall
+if the watcher caught the main thread busy outside ``mainloop`` during that
+very gap; anything else (idle loop, or the overdue heartbeat winning the
+race against the watcher after resume) is dropped.
+"""
+
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from collections.abc import Callable
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+HEARTBEAT_INTERVAL = 0.25  # seconds between heartbeats
+STALL_THRESHOLD = 0.5  # seconds a heartbeat may be late before it counts as a stall
+STALL_HISTORY = 32
+
+
+def _sleep_excluding_clock() -> Callable[[], float]:
+    """Seconds on a clock that doesn't advance while the system is suspended."""
+    if sys.platform == "win32":
+        import ctypes
+
+        query = ctypes.windll.kernel32.QueryUnbiasedInterruptTime
+
+        def clock() -> float:
+            ticks = ctypes.c_ulonglong()  # 100 ns units
+            query(ctypes.byref(ticks))
+            return ticks.value / 1e7
+
+        return clock
+    return time.monotonic  # CLOCK_MONOTONIC / mach_absolute_time stop during suspend
+
+
+_clock = _sleep_excluding_clock()
+
+
+@dataclass
+class StallEvent:
+    started_at: float  # wall-clock time.time()
+    duration: float  # seconds the heartbeat was late
+    stack: str  # main-thread stack captured during the stall
+
+
+class StallWatchdog:
+    def __init__(
+        self,
+        root: Any,
+        interval: float = HEARTBEAT_INTERVAL,
+        threshold: float = STALL_THRESHOLD,
+        capacity: int = STALL_HISTORY,
+    ) -> None:
+        self._root = root
+        self._interval = interval
+        self._threshold = threshold
+        self._events: deque[StallEvent] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._job: str | None = None
+        self._main_ident: int | None = None
+        self._last_beat = 0.0  # _clock() seconds
+        self._stack: str | None = None  # captured for the stall in progress
+        self._stack_beat: float | None = None  # _last_beat the stack belongs to
+        self._stack_idle = False  # main thread was waiting in mainloop
+        self.stall_count = 0
+        self.worst_stall = 0.0
+
+    @property
+    def events(self) -> list[StallEvent]:
+        with self._lock:
+            return list(self._events)
+
+    def start(self) -> None:
+        """Start heartbeating; must be called on the Tk thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._main_ident = threading.get_ident()
+        self._last_beat = _clock()
+        self._stop.clear()
+        self._job = self._root.after(int(self._interval * 1000), self._beat)
+        self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._job:
+            try:
+                self._root.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+        if self.stall_count:
+            log.info("Main-thread stalls: %d, worst %.2fs", self.stall_count, self.worst_stall)
+
+    def _beat(self) -> None:
+        with self._lock:
+            now = _clock()
+            late = now - self._last_beat - self._interval
+            # Only a stack captured since the previous beat belongs to this gap
+            own = self._stack_beat == self._last_beat
+            stack = self._stack if own and not self._stack_idle else None
+            self._last_beat = now
+            self._stack, self._stack_beat, self._stack_idle = None, None, False
+        if late > self._threshold:
+            if stack:
+                self._finish_stall(late, stack)
+            else:
+                log.info("Ignoring %.1fs heartbeat gap: main thread not caught busy "
+                         "(system sleep or idle main loop)", late)
+        if not self._stop.is_set():
+            self._job = self._root.after(int(self._interval * 1000), self._beat)
+
+    def _finish_stall(self, duration: float, stack: str) -> None:
+        with self._lock:
+            self._events.append(StallEvent(time.time() - duration, duration, stack))
+            self.stall_count += 1
+            self.worst_stall = max(self.worst_stall, duration)
+        log.warning("Main thread stalled for %.2fs", duration)
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self._interval / 2):
+            if _clock() - self._last_beat - self._interval <= self._threshold:
+                continue
+            with self._lock:
+                # Recheck: the heartbeat may have landed since the unlocked read
+                beat = self._last_beat
+                late = _clock() - beat - self._interval
+                if late <= self._threshold or self._stack_beat == beat:
+                    continue  # not late any more, or this stall is already captured
+                frame = sys._current_frames().get(self._main_ident)
+                self._stack = "".join(traceback.format_stack(frame)) if frame else ""
+                self._stack_beat = beat
+                self._stack_idle = frame is not None and frame.f_code.co_name == "mainloop"
+                stack, idle = self._stack, self._stack_idle
+            if not idle:
+                log.warning("Main thread unresponsive for %.2fs:\n%s", late, stack)
@@ -9,16 +9,21 @@ import ctypes
 import ctypes.wintypes
 import logging
 import tkinter as tk
+from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import customtkinter as ctk
+from PIL import Image, ImageDraw, ImageFont, ImageTk
 
-from claude_tracker.api import UsageData, fetch_usage
+from claude_tracker.api import UsageBucket, UsageData, fetch_usage
 from claude_tracker.config import Settings
 from claude_tracker.startup import is_startup_enabled, set_startup
+from claude_tracker.watchdog import StallWatchdog
 
 if TYPE_CHECKING:
-    from claude_tracker.tray import TrayManager
+    from claude_tracker.forecast import CapForecast, UsageHistory
+    from claude_tracker.tray import StartupTimer, TrayManager
 
 log = logging.getLogger(__name__)
 
@@ -32,6 +37,9 @@ COLOR_YELLOW = "#eab308"
 COLOR_RED = "#ef4444"
 COLOR_BAR_BG = "#333333"
 
+# Logical size of the info area drawn by the "image" popup renderer
+INFO_W, INFO_H = 296, 180
+
 user32 = ctypes.windll.user32
 
 
@@ -55,15 +63,104 @@ def _get_tray_notify_rect() -> tuple[int, int, int, int] | None:
     return (rect.left, rect.top, rect.right, rect.bottom)
 
 
+@lru_cache(maxsize=16)
+def _popup_font(size: int, bold: bool = False) -> ImageFont.ImageFont:
+    names = ["segoeuib.ttf", "arialbd.ttf"] if bold else ["segoeui.ttf", "arial.ttf"]
+    for name in names:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:  # Pillow < 10.1 only has the fixed-size bitmap font
+        return ImageFont.load_default()
+
+
+def _draw_text(draw: ImageDraw.ImageDraw, xy: tuple[int, int], text: str,
+               font: ImageFont.ImageFont, fill: str, align: str = "left") -> None:
+    """Draw text with its box top at y, anchored left or right at x."""
+    bbox = draw.textbbox((0, 0), text, font=font)
+    x, y = xy
+    if align == "right":
+        x -= bbox[2] - bbox[0]
+    draw.text((x - bbox[0], y - bbox[1]), text, fill=fill, font=font)
+
+
+POPUP_ROWS = (("5-Hour Window", 44), ("7-Day Window", 98))
+
+
+@lru_cache(maxsize=4)
+def _popup_base(scale: float) -> Image.Image:
+    """Static layer of the info area: title, row labels and empty bar tracks."""
+    def px(v: float) -> int:
+        return int(round(v * scale))
+
+    w, h = px(INFO_W), px(INFO_H)
+    img = Image.new("RGB", (w, h), POPUP_BG)
+    draw = ImageDraw.Draw(img)
+    _draw_text(draw, (px(12), px(10)), "Claude Code Usage",
+               _popup_font(px(14), bold=True), COLOR_FG)
+    for title, y in POPUP_ROWS:
+        _draw_text(draw, (px(12), px(y)), title, _popup_font(px(11)), COLOR_LABEL)
+        draw.rounded_rectangle([px(12), px(y + 20), w - px(12 + 48), px(y + 32)],
+                               radius=px(4), fill=COLOR_BAR_BG)
+    return img
+
+
+def _render_popup_info(usage: UsageData | None, scale: float = 1.0,
+                       forecast: "CapForecast | None" = None) -> Image.Image:
+    """Compose the popup info area — title, bars, percentages, reset
+    timers and the 7-day cap forecast — into a single image, sized in
+    physical pixels for ``scale``.
+    """
+    def px(v: float) -> int:
+        return int(round(v * scale))
+
+    img = _popup_base(scale).copy()
+    draw = ImageDraw.Draw(img)
+    w = img.width
+
+    empty = UsageBucket(utilization=0.0, resets_at=None)
+    buckets = (usage.five_hour, usage.seven_day) if usage else (empty, empty)
+    for (_, y), bucket in zip(POPUP_ROWS, buckets):
+        if bucket.time_until_reset:
+            _draw_text(draw, (w - px(12), px(y + 1)), f"resets {bucket.time_until_reset}",
+                       _popup_font(px(10)), COLOR_LABEL, align="right")
+
+        bar_l, bar_r = px(12), w - px(12 + 48)
+        bar_t, bar_b = px(y + 20), px(y + 32)
+        util = min(max(bucket.utilization, 0.0), 100.0)
+        fill_r = bar_l + int((bar_r - bar_l) * util / 100.0)
+        if fill_r > bar_l:
+            draw.rounded_rectangle([bar_l, bar_t, fill_r, bar_b],
+                                   radius=min(px(4), (fill_r - bar_l) // 2),
+                                   fill=_color_for(bucket.utilization))
+
+        _draw_text(draw, (w - px(12), px(y + 19)), f"{bucket.utilization:.0f}%",
+                   _popup_font(px(12), bold=True), COLOR_FG, align="right")
+
+    if forecast:
+        _draw_text(draw, (px(12), px(138)), forecast.summary, _popup_font(px(10)), COLOR_LABEL)
+
+    return img
+
+
 class TrackerWidget:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
         self.tray: "TrayManager | None" = None
+        self.startup: "StartupTimer | None" = None
         self._refresh_job: str | None = None
         self._popup_win: ctk.CTkToplevel | None = None
         self._last_usage: UsageData | None = None
         self._popup_5h: dict | None = None
         self._popup_7d: dict | None = None
+        self._popup_forecast: ctk.CTkLabel | None = None
+        self._history: "UsageHistory | None" = None  # created on the first successful poll
+        self._forecast: "CapForecast | None" = None
+        self._popup_photo: ImageTk.PhotoImage | None = None
+        self._popup_scale = 1.0
 
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("dark-blue")
@@ -72,6 +169,7 @@ class TrackerWidget:
         self.root.title("")
         self.root.overrideredirect(True)
         self.root.withdraw()  # hidden — tray icon is the UI
+        self.watchdog = StallWatchdog(self.root)
 
     def _get_dpi_scale(self) -> float:
         try:
@@ -98,7 +196,7 @@ class TrackerWidget:
         popup.configure(fg_color=POPUP_BG)
         self._popup_win = popup
 
-        popup_w, popup_h = 300, 220
+        popup_w, popup_h = 300, 240
         scale = self._get_dpi_scale()
         popup_w_phys = int(popup_w * scale)
         popup_h_phys = int(popup_h * scale)
@@ -121,9 +219,12 @@ class TrackerWidget:
 
         popup.geometry(f"{popup_w}x{popup_h}+{x}+{y}")
 
-        self._build_popup(popup)
-        if self._last_usage:
-            self._update_popup(self._last_usage)
+        if self.settings.popup_renderer == "image":
+            self._build_image_popup(popup)
+        else:
+            self._build_popup(popup)
+            if self._last_usage:
+                self._update_popup(self._last_usage)
 
         popup.bind("<FocusOut>", lambda _: self.root.after(200, self._close_popup_if_inactive))
         popup.after(100, lambda: popup.focus_force())
@@ -139,7 +240,31 @@ class TrackerWidget:
 
         self._popup_5h = self._build_popup_row(frame, "5-Hour Window")
         self._popup_7d = self._build_popup_row(frame, "7-Day Window")
+        self._popup_forecast = ctk.CTkLabel(frame, text="", font=ctk.CTkFont(size=10),
+                                            text_color=COLOR_LABEL, height=16)
+        self._popup_forecast.pack(anchor="w", padx=14)
+
+        self._build_popup_buttons(frame)
 
+    def _build_image_popup(self, popup: ctk.CTkToplevel) -> None:
+        """Info area as one pre-rendered image on a canvas; only the buttons
+        are real widgets, so updates are a single blit.
+        """
+        frame = ctk.CTkFrame(popup, fg_color=POPUP_BG, corner_radius=10,
+                             border_width=1, border_color=POPUP_BORDER)
+        frame.pack(fill="both", expand=True)
+
+        self._popup_scale = self._get_dpi_scale()
+        image = _render_popup_info(self._last_usage, self._popup_scale, self._forecast)
+        self._popup_photo = ImageTk.PhotoImage(image, master=popup)
+        canvas = tk.Canvas(frame, width=image.width, height=image.height,
+                           bg=POPUP_BG, highlightthickness=0, bd=0)
+        canvas.create_image(0, 0, anchor="nw", image=self._popup_photo)
+        canvas.pack(padx=2, pady=(4, 0))
+
+        self._build_popup_buttons(frame)
+
+    def _build_popup_buttons(self, frame: ctk.CTkFrame) -> None:
         btn_frame = ctk.CTkFrame(frame, fg_color="transparent")
         btn_frame.pack(fill="x", padx=14, pady=(10, 12))
 
@@ -180,6 +305,11 @@ class TrackerWidget:
     def _update_popup(self, usage: UsageData) -> None:
         if not self._popup_win or not self._popup_win.winfo_exists():
             return
+        if self._popup_photo is not None:
+            self._popup_photo.paste(_render_popup_info(usage, self._popup_scale, self._forecast))
+            return
+        if self._popup_forecast is not None:
+            self._popup_forecast.configure(text=self._forecast.summary if self._forecast else "")
         for bucket, row in [(usage.five_hour, self._popup_5h), (usage.seven_day, self._popup_7d)]:
             if row is None:
                 continue
@@ -195,6 +325,8 @@ class TrackerWidget:
         self._popup_win = None
         self._popup_5h = None
         self._popup_7d = None
+        self._popup_forecast = None
+        self._popup_photo = None
 
     def _close_popup_if_inactive(self) -> None:
         if not self._popup_win or not self._popup_win.winfo_exists():
@@ -219,6 +351,8 @@ class TrackerWidget:
 
     def _apply_usage(self, usage: UsageData) -> None:
         self._last_usage = usage
+        if not usage.error and self.settings.forecast_enabled():
+            self._update_forecast(usage)
         self._update_popup(usage)
 
         if self.tray:
@@ -226,6 +360,16 @@ class TrackerWidget:
             self.tray.update_tooltip(
                 f"Claude: 5H {usage.five_hour.utilization:.0f}%  |  7D {usage.seven_day.utilization:.0f}%"
             )
+        if self.startup:
+            self.startup.mark("poll")
+
+    def _update_forecast(self, usage: UsageData) -> None:
+        if self._history is None:
+            from claude_tracker.forecast import UsageHistory  # pulls in NumPy
+
+            self._history = UsageHistory()
+        self._history.record(usage)
+        self._forecast = self._history.forecast(usage.seven_day)
 
     def start_polling(self) -> None:
         self._poll()
@@ -243,28 +387,41 @@ class TrackerWidget:
 
     def open_settings(self) -> None:
         self._close_popup()
-        SettingsDialog(self)
+        SettingsDialog(self.root, self.settings, self._restart_polling)
+
+    def _restart_polling(self) -> None:
+        if self._refresh_job:
+            self.root.after_cancel(self._refresh_job)
+        self.start_polling()
+
+    def remember_tray_subkey(self, subkey: str) -> None:
+        """Cache the auto-pin registry entry; runs on the Tk thread like every other save."""
+        if subkey != self.settings.tray_icon_subkey:
+            self.settings.tray_icon_subkey = subkey
+            self.settings.save()
 
     def quit_app(self) -> None:
         self._close_popup()
         if self._refresh_job:
             self.root.after_cancel(self._refresh_job)
+        self.watchdog.stop()
         if self.tray:
             self.tray.stop()
         self.root.destroy()
 
     def run(self) -> None:
+        self.watchdog.start()
         self.root.mainloop()
 
 
 class SettingsDialog:
-    def __init__(self, widget: TrackerWidget) -> None:
-        self._widget = widget
-        self._settings = widget.settings
+    def __init__(self, master: tk.Misc, settings: Settings, on_save: Callable[[], None]) -> None:
+        self._settings = settings
+        self._on_save = on_save
 
-        self._win = ctk.CTkToplevel(widget.root)
+        self._win = ctk.CTkToplevel(master)
         self._win.title("Claude Tracker Settings")
-        self._win.geometry("320x200")
+        self._win.geometry("320x230")
         self._win.resizable(False, False)
         self._win.attributes("-topmost", True)
         self._win.configure(fg_color=POPUP_BG)
@@ -286,6 +443,11 @@ class SettingsDialog:
                         text_color=COLOR_FG, fg_color=COLOR_GREEN,
                         hover_color="#16a34a").pack(anchor="w", **pad)
 
+        self._image_popup_var = tk.BooleanVar(value=self._settings.popup_renderer == "image")
+        ctk.CTkCheckBox(self._win, text="Single-image popup", variable=self._image_popup_var,
+                        text_color=COLOR_FG, fg_color=COLOR_GREEN,
+                        hover_color="#16a34a").pack(anchor="w", **pad)
+
         btn_frame = ctk.CTkFrame(self._win, fg_color="transparent")
         btn_frame.pack(fill="x", padx=16, pady=16)
         ctk.CTkButton(btn_frame, text="Save", width=80, command=self._save,
@@ -303,10 +465,22 @@ class SettingsDialog:
 
         set_startup(self._boot_var.get())
         self._settings.start_on_boot = self._boot_var.get()
+        self._settings.popup_renderer = "image" if self._image_popup_var.get() else "widgets"
         self._settings.save()
-
-        if self._widget._refresh_job:
-            self._widget.root.after_cancel(self._widget._refresh_job)
-        self._widget.start_polling()
+        self._on_save()
 
         self._win.destroy()
+
+
+def run_settings_dialog() -> None:
+    """Show only the Settings dialog; lite mode runs this in a child process."""
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("dark-blue")
+
+    root = ctk.CTk()
+    root.title("")
+    root.overrideredirect(True)
+    root.withdraw()
+    dialog = SettingsDialog(root, Settings.load(), lambda: None)
+    root.wait_window(dialog._win)
+    root.destroy()
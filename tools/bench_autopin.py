@@ -0,0 +1,103 @@
+"""Benchmark and check tray auto-pin against an in-memory NotifyIconSettings.
+
+Times the full subkey scan of a first launch against the cached lookup of
+later launches, and checks that the shell is only notified when
+``IsPromoted`` actually changes. Runs headless on Linux:
+
+    uv run python tools/bench_autopin.py --entries 500
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from soak import _install_windows_stubs
+
+
+def _entries(count: int, ours_at: int, exe_path: str) -> dict[str, dict[str, object]]:
+    entries: dict[str, dict[str, object]] = {}
+    for i in range(count):
+        entries[f"{10**18 + i * 7919}"] = {
+            "InitialTooltip": f"App {i}",
+            "ExecutablePath": rf"C:\Program Files\Vendor{i}\app{i}.exe",
+            "IsPromoted": i % 2,
+        }
+    entries[f"{10**18 + ours_at * 7919}"] = {
+        "InitialTooltip": "Claude Tracker",
+        "ExecutablePath": exe_path,
+        "IsPromoted": 0,
+    }
+    return entries
+
+
+def _time(fn, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(runs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    _install_windows_stubs()
+
+    from claude_tracker.config import Settings
+    from claude_tracker.tray import MemoryNotifyIconStore, _promote_tray_icon
+
+    exe_path = os.path.abspath(sys.executable)
+    broadcasts = []
+
+    def launch(store: MemoryNotifyIconStore, settings: Settings | None) -> bool:
+        if settings is None:
+            return _promote_tray_icon(store, broadcast=lambda: broadcasts.append(1))
+        return _promote_tray_icon(store, settings.tray_icon_subkey,
+                                  on_match=lambda subkey: setattr(settings, "tray_icon_subkey", subkey),
+                                  broadcast=lambda: broadcasts.append(1))
+
+    # First launch: full scan, promotes, caches, broadcasts once.
+    store = MemoryNotifyIconStore(_entries(args.entries, args.entries - 1, exe_path))
+    settings = Settings()
+    assert launch(store, settings)
+    assert settings.tray_icon_subkey, "matched subkey was not cached"
+    assert store.entries[settings.tray_icon_subkey]["IsPromoted"] == 1
+    assert len(broadcasts) == 1, broadcasts
+    scan_reads = store.reads
+
+    # Later launch: cached lookup, already promoted, no broadcast.
+    store.reads = 0
+    assert launch(store, settings)
+    assert store.reads == 1, store.reads
+    assert len(broadcasts) == 1, broadcasts
+
+    # User un-pinned the icon: cached lookup re-promotes and broadcasts.
+    store.entries[settings.tray_icon_subkey]["IsPromoted"] = 0
+    assert launch(store, settings)
+    assert len(broadcasts) == 2, broadcasts
+
+    # Stale cache (entry for an old install) falls back to a scan.
+    stale = settings.tray_icon_subkey
+    store.entries[stale]["ExecutablePath"] = r"C:\Old\ClaudeTracker.exe"
+    store.entries[stale]["IsPromoted"] = 1
+    store.entries["fresh"] = {"ExecutablePath": exe_path, "IsPromoted": 0}
+    assert launch(store, settings)
+    assert store.entries["fresh"]["IsPromoted"] == 1
+    assert settings.tray_icon_subkey == "fresh", settings.tray_icon_subkey
+    print("promotion logic: ok")
+
+    scan_store = MemoryNotifyIconStore(_entries(args.entries, args.entries - 1, exe_path))
+    scan_ms = _time(lambda: launch(scan_store, None), args.repeat)
+    cached_ms = _time(lambda: launch(store, settings), args.repeat)
+    print(f"{args.entries} entries, full scan:   {scan_ms:8.3f} ms  ({scan_reads} subkey reads)")
+    print(f"{args.entries} entries, cached hit:  {cached_ms:8.3f} ms  (1 subkey read)")
+
+
+if __name__ == "__main__":
+    main()
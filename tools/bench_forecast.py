@@ -0,0 +1,190 @@
+"""Benchmark and check the 7-day cap forecast on synthetic usage history.
+
+Checks ``fit_profile`` and ``simulate`` against histories whose answer is
+known: a fixed weekday pattern with a predictable cap time, a bimodal mix
+of heavy and light weeks, gaps in polling, 7-day resets and samples with no
+``resets_at``. Then times a fit and simulation over a year of 30 s samples.
+Needs only NumPy:
+
+    uv run python tools/bench_forecast.py
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from claude_tracker import forecast
+from claude_tracker.api import UsageBucket, UsageData
+from claude_tracker.forecast import (
+    HOUR, SAMPLE_DTYPE, WEEK_HOURS, UsageHistory, fit_profile, simulate,
+)
+
+WEEK = WEEK_HOURS * HOUR
+DAY = 24 * HOUR
+MONDAY = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()  # Monday 00:00 UTC
+STEP = 30  # seconds between polls
+WORK_RATE = 2.0  # percent per hour, Mon-Fri 09:00-17:00 -> 80% per week
+
+
+def _work_hours(hour_of_week: np.ndarray) -> np.ndarray:
+    day, hour = np.divmod(hour_of_week, 24)
+    return (day < 5) & (hour >= 9) & (hour < 17)
+
+
+def _history(weeks: int, rate_at=None, start: float = MONDAY) -> np.ndarray:
+    """Polls every STEP seconds; utilization accumulates per week and resets on Monday."""
+    rate_at = rate_at or (lambda how, week: np.where(_work_hours(how), WORK_RATE, 0.0))
+    t = np.arange(start, start + weeks * WEEK, STEP, dtype=np.float64)
+    week = ((t - MONDAY) // WEEK).astype(np.int64)
+    how = ((t - MONDAY) % WEEK // HOUR).astype(np.int64)
+    step_use = rate_at(how, week) * STEP / HOUR  # used between this poll and the next
+    used = np.cumsum(step_use) - step_use
+    util = used - used[np.searchsorted(week, week)]
+
+    samples = np.zeros(len(t), dtype=SAMPLE_DTYPE)
+    samples["t"] = t
+    samples["util"] = np.minimum(util, 100.0)
+    samples["resets"] = MONDAY + (week + 1) * WEEK
+    return samples
+
+
+def _at(days: float, week: int = 0) -> float:
+    return MONDAY + week * WEEK + days * DAY
+
+
+def check_weekday_pattern() -> None:
+    profile = fit_profile(_history(4))
+    assert profile is not None and profile.shape == (4, WEEK_HOURS), profile
+    work = _work_hours(np.arange(WEEK_HOURS))
+    assert np.allclose(profile[:, work], WORK_RATE, atol=0.01), profile[:, work]
+    assert np.allclose(profile[:, ~work], 0.0, atol=0.01)
+
+    # From Monday 00:00 at 31%: 16% a day, 95% by Thursday night, capped 2.5 h
+    # into Friday's work, i.e. during the 11:00 hour
+    now = _at(0, week=4)
+    result = simulate(profile, 31.0, now, now + WEEK, rng=np.random.default_rng(1))
+    assert result.probability == 1.0, result
+    assert result.likely_cap_at == datetime.fromtimestamp(_at(4 + 12 / 24, week=4), timezone.utc), result
+
+    # From Friday 00:00 the path runs through the weekend into next week: Thursday 12:00
+    now = _at(4, week=4)
+    result = simulate(profile, 31.0, now, now + WEEK, rng=np.random.default_rng(1))
+    assert result.likely_cap_at == datetime.fromtimestamp(_at(3 + 12 / 24, week=5), timezone.utc), result
+
+    # From 10% on Monday, four work days only reach 74%: no cap before a Friday reset
+    now = _at(0, week=4)
+    result = simulate(profile, 10.0, now, _at(4, week=4), rng=np.random.default_rng(1))
+    assert result.probability == 0.0 and result.likely_cap_at is None, result
+
+
+def check_bimodal_weeks() -> None:
+    # Half the weeks use 160% spread over the week, half use nothing. Whole-week
+    # replay from 30% caps on exactly the heavy half.
+    profile = np.zeros((10, WEEK_HOURS))
+    profile[::2] = 160.0 / WEEK_HOURS
+    now = _at(0, week=10)
+    result = simulate(profile, 30.0, now, now + WEEK, rng=np.random.default_rng(7))
+    assert abs(result.probability - 0.5) < 0.03, result
+
+    # And through fit_profile: heavy weeks at 1.6 %/h (capped by the API at 100%)
+    def rate_at(how, week):
+        return np.where(week % 2 == 0, 160.0 / WEEK_HOURS, 0.0)
+
+    profile = fit_profile(_history(10, rate_at))
+    assert profile is not None
+    result = simulate(profile, 30.0, now, now + WEEK, rng=np.random.default_rng(7))
+    assert abs(result.probability - 0.5) < 0.03, result
+
+
+def check_gaps() -> None:
+    samples = _history(4)
+    # Polling stops Tuesday 10:00-16:00 of week 1; the usage in between shows
+    # up as one jump once polling resumes and must not be pinned on one hour
+    gap = (samples["t"] >= _at(1 + 10 / 24, week=1)) & (samples["t"] < _at(1 + 16 / 24, week=1))
+    samples = samples[~gap]
+    profile = fit_profile(samples)
+    assert profile is not None
+    assert profile.max() <= WORK_RATE + 0.01, profile.max()
+    tuesday = slice(24 + 10, 24 + 16)
+    assert np.allclose(profile[1, tuesday], WORK_RATE, atol=0.01), profile[1, tuesday]
+
+    # Too little to go on
+    assert fit_profile(_history(4)[:: 3 * HOUR // STEP]) is None  # every poll gap > MAX_GAP
+    assert fit_profile(_history(1)[: 12 * HOUR // STEP]) is None  # < MIN_OBSERVED_HOURS
+
+
+def check_resets() -> None:
+    samples = _history(4)
+    # Week 2 resets early on Wednesday 00:00: utilization drops and resets_at moves
+    early = samples["t"] >= _at(2, week=2)
+    in_week = early & (samples["t"] < _at(0, week=3))
+    samples["util"][in_week] -= samples["util"][np.argmax(early)]
+    samples["resets"][in_week] = _at(7 + 2, week=2)
+    # Utilization falling with the same resets_at (usage aging out) counts as zero, not negative
+    samples["util"][(samples["t"] >= _at(3 + 10 / 24, week=1)) & (samples["t"] < _at(0, week=2))] -= 30
+    profile = fit_profile(samples)
+    assert profile is not None
+    assert profile.min() >= 0.0, profile.min()
+    assert profile.max() <= WORK_RATE + 0.01, profile.max()
+
+    assert simulate(profile, 100.0, MONDAY, MONDAY + WEEK).probability == 1.0
+    assert simulate(profile, 50.0, MONDAY, MONDAY - 1).probability == 0.0
+
+
+def check_missing_resets_at() -> None:
+    samples = _history(4)
+    # Week 3 polled without resets_at, with nonsense utilization
+    week3 = samples["t"] >= _at(0, week=3)
+    samples["resets"][week3] = 0.0
+    samples["util"][week3] = np.arange(week3.sum()) % 100
+    profile = fit_profile(samples)
+    assert profile is not None and profile.shape[0] == 3, profile.shape
+    assert profile.max() <= WORK_RATE + 0.01, profile.max()
+
+    samples["resets"] = 0.0
+    assert fit_profile(samples) is None
+
+    # The store records a missing reset as 0 and has no forecast to give
+    history = UsageHistory(Path(tempfile.mkdtemp(prefix="claude-tracker-forecast-")) / "history.bin")
+    bucket = UsageBucket(utilization=42.0, resets_at=None)
+    history.record(UsageData(five_hour=bucket, seven_day=bucket), now=MONDAY)
+    assert history.samples["resets"][0] == 0.0
+    assert history.forecast(bucket, now=MONDAY) is None
+
+
+def _time(fn, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(runs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for check in (check_weekday_pattern, check_bimodal_weeks, check_gaps,
+                  check_resets, check_missing_resets_at):
+        check()
+        print(f"{check.__name__}: ok")
+
+    year = _history(52)
+    recent = year[np.searchsorted(year["t"], year["t"][-1] - forecast.PROFILE_WEEKS * WEEK):]
+    profile = fit_profile(recent)
+    now = year["t"][-1]
+    fit_ms = _time(lambda: fit_profile(recent), args.repeat)
+    sim_ms = _time(lambda: simulate(profile, 31.0, now, now + WEEK), args.repeat)
+    print(f"{len(year)} samples (52 weeks), fit last {forecast.PROFILE_WEEKS} weeks: {fit_ms:7.2f} ms")
+    print(f"simulate {forecast.PATHS} paths x {WEEK_HOURS} h:            {sim_ms:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Benchmark the popup renderers: first-show and update times.
+
+Compares the customtkinter widget tree (``_build_popup``/``_update_popup``)
+against the single-image renderer (``popup_renderer = "image"``). Uses the
+same Windows stubs as the soak harness, so it runs headless on Linux:
+
+    xvfb-run -a uv run python tools/bench_popup.py
+
+``--render-only`` times just the Pillow composition of the image renderer,
+which needs no display. Off Windows, Segoe UI and Arial aren't found and
+``_popup_font`` falls back to Pillow's built-in font; pass ``--font`` (and
+``--bold-font``) to time a real TrueType face instead:
+
+    uv run python tools/bench_popup.py --render-only \
+        --font /usr/share/fonts/truetype/dejavu/DejaVuSans.ttf \
+        --bold-font /usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from soak import _install_windows_stubs
+
+
+def _usage(n: int):
+    from claude_tracker.api import UsageBucket, UsageData
+
+    now = datetime.now(timezone.utc)
+    return UsageData(
+        five_hour=UsageBucket((n * 7) % 101, now + timedelta(minutes=300 - n % 300)),
+        seven_day=UsageBucket((n // 3) % 101, now + timedelta(hours=168 - n % 168)),
+    )
+
+
+def _bench(renderer: str, shows: int, updates: int) -> tuple[list[float], list[float]]:
+    from claude_tracker.config import Settings
+    from claude_tracker.widget import TrackerWidget
+
+    widget = TrackerWidget(Settings(popup_renderer=renderer))
+    widget._last_usage = _usage(0)
+    root = widget.root
+    show_ms: list[float] = []
+    update_ms: list[float] = []
+    try:
+        for i in range(shows):
+            t0 = time.perf_counter()
+            widget._show_popup()
+            root.update()
+            show_ms.append((time.perf_counter() - t0) * 1000)
+
+            for j in range(updates):
+                t0 = time.perf_counter()
+                widget._update_popup(_usage(i * updates + j + 1))
+                root.update_idletasks()
+                update_ms.append((time.perf_counter() - t0) * 1000)
+
+            widget._close_popup()
+            root.update()
+    finally:
+        root.destroy()
+    return show_ms, update_ms
+
+
+def _use_fonts(regular: str, bold_path: str | None) -> None:
+    from functools import lru_cache
+
+    from PIL import ImageFont
+
+    from claude_tracker import widget
+
+    @lru_cache(maxsize=16)
+    def popup_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+        return ImageFont.truetype(bold_path if bold and bold_path else regular, size)
+
+    widget._popup_font = popup_font
+    widget._popup_base.cache_clear()
+
+
+def _font_name() -> str:
+    from claude_tracker.widget import _popup_font
+
+    font = _popup_font(12)
+    path = getattr(font, "path", None)
+    return os.path.basename(path) if isinstance(path, str) else "Pillow built-in font"
+
+
+def _bench_render(updates: int) -> dict[float, list[float]]:
+    from claude_tracker.forecast import CapForecast
+    from claude_tracker.widget import _render_popup_info
+
+    forecast = CapForecast(0.35, datetime.now(timezone.utc) + timedelta(days=2))
+    results: dict[float, list[float]] = {}
+    for scale in (1.0, 1.5, 2.0):
+        _render_popup_info(_usage(0), scale, forecast)  # warm the font cache
+        runs = []
+        for i in range(updates):
+            t0 = time.perf_counter()
+            _render_popup_info(_usage(i + 1), scale, forecast)
+            runs.append((time.perf_counter() - t0) * 1000)
+        results[scale] = runs
+    return results
+
+
+def _fmt(samples: list[float]) -> str:
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return f"median {statistics.median(samples):7.2f} ms   p95 {p95:7.2f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shows", type=int, default=30)
+    parser.add_argument("--updates", type=int, default=50, help="updates per shown popup")
+    parser.add_argument("--render-only", action="store_true",
+                        help="time the image composition only; no display needed")
+    parser.add_argument("--font", help="TrueType file to use instead of Segoe UI / Arial")
+    parser.add_argument("--bold-font", help="bold TrueType file to go with --font")
+    args = parser.parse_args()
+
+    _install_windows_stubs()
+    if args.font:
+        _use_fonts(args.font, args.bold_font)
+    if args.render_only:
+        print(f"font: {_font_name()}")
+        for scale, runs in _bench_render(args.shows * args.updates).items():
+            print(f"image compose @{scale:.1f}x: {_fmt(runs)}")
+        return
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        sys.exit("No DISPLAY — run under a virtual display, e.g. `xvfb-run -a ...`")
+
+    for renderer in ("widgets", "image"):
+        show_ms, update_ms = _bench(renderer, args.shows, args.updates)
+        print(f"{renderer:8s} first show: {_fmt(show_ms)}")
+        print(f"{renderer:8s} update:     {_fmt(update_ms)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Compare startup time and RSS of the default and lite run modes.
+
+Each mode runs in a fresh child process against the soak harness's stub API,
+with the Windows-only calls stubbed and a no-op tray backend. Reported per
+mode:
+
+- import: time and RSS after importing the mode's modules
+- ready:  time and RSS once the tray icon is up and the first poll applied
+  (the same point ``StartupTimer`` logs in the real app)
+
+The default mode creates a Tk root, so without a display only its import
+phase is measured. For the full comparison:
+
+    xvfb-run -a uv run python tools/bench_startup.py
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from soak import FakeClock, _install_windows_stubs, _rss_mb, _start_stub_api
+
+
+def _patch_tray_backend() -> None:
+    """Replace the dummy pystray backend with one that can run and stop."""
+    import pystray
+
+    class BenchIcon(pystray.Icon):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            self._stopped = threading.Event()
+
+        def _run(self) -> None:
+            self._mark_ready()
+            self._stopped.wait()
+
+        def _run_detached(self) -> None:
+            self._mark_ready()
+
+        def _update_icon(self) -> None:
+            pass
+
+        def _update_title(self) -> None:
+            pass
+
+        def _update_menu(self) -> None:
+            pass
+
+        def _show(self) -> None:
+            pass
+
+        def _hide(self) -> None:
+            pass
+
+        def _stop(self) -> None:
+            self._stopped.set()
+
+    pystray.Icon = BenchIcon
+
+
+def _point_at_stubs(tmp: Path, cap_forecast: bool) -> None:
+    from claude_tracker import api, config
+
+    server = _start_stub_api(FakeClock())
+    api.USAGE_URL = f"http://127.0.0.1:{server.server_address[1]}/api/oauth/usage"
+    api.CREDENTIALS_PATH = tmp / ".credentials.json"
+    api.CREDENTIALS_PATH.write_text(json.dumps({"claudeAiOauth": {
+        "accessToken": "bench",
+        "refreshToken": "bench",
+        "expiresAt": int(time.time() * 1000) + 86400 * 1000,
+    }}), encoding="utf-8")
+    config.SETTINGS_PATH = tmp / "tracker-settings.json"
+    if cap_forecast:  # importing forecast loads NumPy, which is what's measured
+        from claude_tracker import forecast
+
+        forecast.HISTORY_PATH = tmp / "tracker-history.bin"
+
+
+def _child(mode: str, cap_forecast: bool) -> None:
+    _install_windows_stubs()
+    result: dict = {"mode": mode, "baseline_rss_mb": _rss_mb()}
+
+    t0 = time.perf_counter()
+    from claude_tracker.config import Settings
+    from claude_tracker.tray import StartupTimer, TrayManager
+
+    if mode == "lite":
+        from claude_tracker.lite import LiteTracker
+    else:
+        from claude_tracker.widget import TrackerWidget
+    result["import_ms"] = (time.perf_counter() - t0) * 1000
+    result["import_rss_mb"] = _rss_mb()
+
+    if mode == "default" and sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        print(json.dumps(result))
+        return
+
+    _patch_tray_backend()
+    _point_at_stubs(Path(tempfile.mkdtemp(prefix="claude-tracker-startup-")), cap_forecast)
+    settings = Settings(cap_forecast=cap_forecast)
+    timer = StartupTimer(mode, t0)
+
+    if mode == "lite":
+        tracker = LiteTracker(settings)
+        tracker.startup = timer
+        threading.Thread(target=tracker.run, daemon=True).start()
+        while timer.ready_ms is None:
+            time.sleep(0.005)
+        tracker.quit_app()
+    else:
+        widget = TrackerWidget(settings)
+        tray = TrayManager(widget)
+        widget.set_tray(tray)
+        widget.startup = tray.startup = timer
+        tray.start()
+        widget.start_polling()
+        while timer.ready_ms is None:
+            widget.root.update()
+            time.sleep(0.005)
+        widget.quit_app()
+
+    result["ready_ms"] = timer.ready_ms
+    result["ready_rss_mb"] = _rss_mb()
+    result["numpy_loaded"] = "numpy" in sys.modules
+    result["tk_loaded"] = "_tkinter" in sys.modules
+    print(json.dumps(result))
+
+
+def _run_child(mode: str, cap_forecast: bool) -> dict:
+    cmd = [sys.executable, __file__, "--child", mode]
+    if not cap_forecast:
+        cmd.append("--no-forecast")
+    out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--child", choices=("default", "lite"), help=argparse.SUPPRESS)
+    parser.add_argument("--no-forecast", action="store_true", help="run with cap_forecast off")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, not args.no_forecast)
+        return
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        print("No DISPLAY — default mode: import phase only (run under `xvfb-run -a` for the rest)")
+
+    for mode in ("default", "lite"):
+        for cap_forecast in (True, False):
+            runs = [_run_child(mode, cap_forecast) for _ in range(args.runs)]
+            best = min(runs, key=lambda r: (r.get("ready_ms") or 0, r["import_ms"]))
+            label = f"{mode} (forecast {'on' if cap_forecast else 'off'})"
+            line = f"{label:24s} import {best['import_ms']:6.0f} ms {best['import_rss_mb']:6.1f} MB"
+            if "ready_ms" in best:
+                line += (f"   ready {best['ready_ms']:6.0f} ms {best['ready_rss_mb']:6.1f} MB"
+                         f"   (numpy={best['numpy_loaded']}, tk={best['tk_loaded']})")
+            print(line)
+    print(f"bare interpreter {best['baseline_rss_mb']:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Check the main-thread stall watchdog against a fake Tk root.
+
+The fake root runs ``after`` callbacks from a heap on the calling thread,
+so stalls, an idle main loop and system sleep can be staged without Tk or a
+display. Each case asserts what ends up in ``stall_count`` / ``events``:
+
+    uv run python tools/check_watchdog.py
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+from claude_tracker import watchdog
+from claude_tracker.watchdog import StallWatchdog
+
+INTERVAL = 0.05
+THRESHOLD = 0.2
+SETTLE = 1.0  # seconds of event loop after each staged gap
+
+
+class FakeRoot:
+    """``after`` / ``after_cancel`` on a heap, pumped by ``run_for``."""
+
+    def __init__(self) -> None:
+        self._queue: list[tuple[float, int, object]] = []
+        self._seq = itertools.count()
+
+    def after(self, ms: int, fn) -> str:
+        heapq.heappush(self._queue, (time.monotonic() + ms / 1000, next(self._seq), fn))
+        return "after#"
+
+    def after_cancel(self, job: str) -> None:
+        pass
+
+    def run_for(self, seconds: float) -> None:
+        end = time.monotonic() + seconds
+        while time.monotonic() < end:
+            if self._queue and self._queue[0][0] <= time.monotonic():
+                heapq.heappop(self._queue)[2]()
+            else:
+                time.sleep(0.005)
+
+
+def busy_callback() -> None:
+    time.sleep(3 * THRESHOLD)
+
+
+def mainloop() -> None:
+    """Named like Tk's loop: the main thread is idle, not stuck in our code."""
+    time.sleep(3 * THRESHOLD)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    real_clock = watchdog._clock
+    root = FakeRoot()
+    dog = StallWatchdog(root, interval=INTERVAL, threshold=THRESHOLD)
+    dog.start()
+    main_ident = threading.get_ident()
+    try:
+        root.run_for(SETTLE)
+        assert dog.stall_count == 0, dog.events
+
+        # A real stall is recorded with the stack of the code that caused it
+        root.after(0, busy_callback)
+        root.run_for(SETTLE)
+        assert dog.stall_count == 1, dog.events
+        assert "busy_callback" in dog.events[0].stack, dog.events[0].stack
+        print("busy callback: recorded")
+
+        # Main thread waiting in mainloop (e.g. Windows sleep with a clock that
+        # keeps counting, caught by the watcher): dropped
+        root.after(0, mainloop)
+        root.run_for(SETTLE)
+        assert dog.stall_count == 1, dog.events
+        print("idle mainloop gap: dropped")
+
+        # Resume from an hour of sleep on a clock that counted it, where the
+        # overdue heartbeat runs before the watcher looks: no stack, dropped
+        jump = {"offset": 0.0}
+        watchdog._clock = lambda: real_clock() + (
+            jump["offset"] if threading.get_ident() == main_ident else 0.0)
+        root.after(0, lambda: jump.update(offset=3600.0))
+        root.run_for(SETTLE)
+        watchdog._clock = lambda: real_clock() + jump["offset"]  # watcher catches up
+        root.run_for(SETTLE)
+        assert dog.stall_count == 1, dog.events
+        assert dog.worst_stall < 3600, dog.worst_stall
+        print("heartbeat wins the race after resume: dropped")
+
+        # The wall clock jumping alone doesn't move the watchdog's clock
+        real_time = watchdog.time.time
+        watchdog.time.time = lambda: real_time() + 7200
+        try:
+            root.run_for(SETTLE)
+        finally:
+            watchdog.time.time = real_time
+        assert dog.stall_count == 1, dog.events
+        print("wall-clock jump: ignored")
+
+        # And a real stall afterwards still counts
+        root.after(0, busy_callback)
+        root.run_for(SETTLE)
+        assert dog.stall_count == 2 and "busy_callback" in dog.events[1].stack, dog.events
+        assert dog.worst_stall < 10 * THRESHOLD, dog.worst_stall
+        print(f"later busy callback: recorded (worst {dog.worst_stall:.2f}s)")
+    finally:
+        dog.stop()
+        watchdog._clock = real_clock
+
+
+if __name__ == "__main__":
+    main()
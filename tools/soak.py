@@ -0,0 +1,312 @@
+"""Soak test harness for long-running memory and handle leaks.
+
+Drives the tracker through tens of thousands of poll / popup / icon cycles on
+an accelerated fake clock, feeding varying payloads from a local stub API, and
+samples RSS, Python object counts, thread counts and Tk widget / ``after``
+counts as it goes. A least-squares slope is fitted to each metric over all
+samples after warm-up; the run exits non-zero if any metric grows faster per
+cycle than its tolerance, so the check scales with ``--cycles``.
+
+Runs headless on Linux under a virtual display — the Windows-only bits
+(``ctypes.windll``, ``winreg``) are stubbed before the app modules load:
+
+    xvfb-run -a uv run python tools/soak.py --cycles 20000
+
+``--renderer image`` soaks the single-image popup, which creates a new
+``ImageTk.PhotoImage`` each time it opens; ``--renderer both`` runs the two
+renderers back to back.
+"""
+
+import argparse
+import ctypes
+import gc
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import types
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+log = logging.getLogger("soak")
+
+# Fitted growth per poll cycle above which a metric is reported as leaking.
+# At the default 20 000 cycles, 0.1 KB/cycle is ~2 MB over the run.
+MAX_GROWTH_PER_CYCLE = {
+    "rss_mb": 0.1 / 1024,
+    "objects": 0.01,
+    "threads": 0.0002,
+    "tk_widgets": 0.0002,
+    "tk_after": 0.0002,
+}
+MIN_SAMPLES = 8
+
+
+# ── Windows stubs ────────────────────────────────────────────────
+
+
+class _FakeUser32:
+    """Enough of user32 for the popup to fall back to screen-corner placement."""
+
+    def FindWindowW(self, *args) -> int:
+        return 0
+
+    def FindWindowExW(self, *args) -> int:
+        return 0
+
+    def GetWindowRect(self, *args) -> int:
+        return 0
+
+    def SendMessageW(self, *args) -> int:
+        return 0
+
+
+def _install_windows_stubs() -> None:
+    if not hasattr(ctypes, "windll"):
+        ctypes.windll = types.SimpleNamespace(user32=_FakeUser32())
+    if "winreg" not in sys.modules:
+        winreg = types.ModuleType("winreg")
+        winreg.HKEY_CURRENT_USER = 0x80000001
+        winreg.KEY_READ = 0x20019
+        winreg.KEY_SET_VALUE = 0x0002
+        winreg.REG_SZ = 1
+        winreg.REG_DWORD = 4
+
+        def _missing(*args, **kwargs):
+            raise FileNotFoundError("registry is not available in the soak harness")
+
+        for name in ("OpenKey", "EnumKey", "QueryValueEx", "SetValueEx",
+                     "DeleteValue", "CloseKey"):
+            setattr(winreg, name, _missing)
+        sys.modules["winreg"] = winreg
+    # pystray picks a backend at import time; the dummy one needs no X/GTK
+    os.environ.setdefault("PYSTRAY_BACKEND", "dummy")
+
+
+# ── Fake clock & stub API ────────────────────────────────────────
+
+
+class FakeClock:
+    """Wall clock that only moves when the harness advances it."""
+
+    def __init__(self) -> None:
+        self._now = datetime.now(timezone.utc)
+        self._lock = threading.Lock()
+
+    def now(self) -> datetime:
+        with self._lock:
+            return self._now
+
+    def advance(self, seconds: float) -> None:
+        with self._lock:
+            self._now += timedelta(seconds=seconds)
+
+
+def _fake_datetime(clock: FakeClock) -> type:
+    class _FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            now = clock.now()
+            return now.astimezone(tz) if tz else now.replace(tzinfo=None)
+
+    return _FakeDatetime
+
+
+def _payload(clock: FakeClock, n: int) -> dict:
+    """Usage payload that sweeps both buckets and their reset times."""
+    now = clock.now()
+    five_reset = now + timedelta(seconds=5 * 3600 - (n * 60) % (5 * 3600))
+    seven_reset = now + timedelta(seconds=7 * 86400 - (n * 60) % (7 * 86400))
+    payload = {
+        "five_hour": {"utilization": (n * 7) % 101, "resets_at": five_reset.isoformat()},
+        "seven_day": {"utilization": (n // 3) % 101, "resets_at": seven_reset.isoformat()},
+    }
+    if n % 11 == 0:
+        payload["seven_day"]["resets_at"] = None
+    if n % 13 == 0:
+        payload["five_hour"] = None
+    return payload
+
+
+def _start_stub_api(clock: FakeClock) -> ThreadingHTTPServer:
+    counter = {"n": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            counter["n"] += 1
+            n = counter["n"]
+            if n % 97 == 0:
+                self.send_response(500)
+                self.end_headers()
+                return
+            body = json.dumps(_payload(clock, n)).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ── Metrics ──────────────────────────────────────────────────────
+
+
+class _FakeIcon:
+    """Stands in for pystray.Icon so update_icon/update_tooltip do real work."""
+
+    icon = None
+    title = ""
+
+    def stop(self) -> None:
+        pass
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        resident_pages = int(f.read().split()[1])
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def _count_widgets(widget) -> int:
+    return 1 + sum(_count_widgets(child) for child in widget.winfo_children())
+
+
+def _sample(root) -> dict:
+    gc.collect()
+    return {
+        "rss_mb": _rss_mb(),
+        "objects": len(gc.get_objects()),
+        "threads": threading.active_count(),
+        "tk_widgets": _count_widgets(root),
+        "tk_after": len(root.tk.splitlist(root.tk.call("after", "info"))),
+    }
+
+
+def _find_leaks(samples: list[dict]) -> list[str]:
+    cycles = [s["cycle"] for s in samples]
+    leaks = []
+    for metric, allowed in MAX_GROWTH_PER_CYCLE.items():
+        values = [s[metric] for s in samples]
+        slope, _ = statistics.linear_regression(cycles, values)
+        if slope > allowed:
+            leaks.append(f"{metric}: {values[0]:g} -> {values[-1]:g}, "
+                         f"{slope * 1000:+.3g} per 1000 cycles (allowed {allowed * 1000:+.3g})")
+    return leaks
+
+
+# ── Driver ───────────────────────────────────────────────────────
+
+
+def _pump(root) -> None:
+    root.update_idletasks()
+    root.update()
+
+
+def run(cycles: int, sample_every: int, warmup: int, interval: int, renderer: str = "widgets") -> int:
+    _install_windows_stubs()
+
+    from claude_tracker import api, forecast, tray as tray_mod
+    from claude_tracker.config import Settings
+    from claude_tracker.tray import TrayManager
+    from claude_tracker.widget import TrackerWidget
+
+    clock = FakeClock()
+    api.datetime = _fake_datetime(clock)
+
+    server = _start_stub_api(clock)
+    api.USAGE_URL = f"http://127.0.0.1:{server.server_address[1]}/api/oauth/usage"
+
+    tmp = Path(tempfile.mkdtemp(prefix="claude-tracker-soak-"))
+    api.CREDENTIALS_PATH = tmp / ".credentials.json"
+    forecast.HISTORY_PATH = tmp / "tracker-history.bin"
+    # Record, fit and simulate the cap forecast on the fake clock too, so the
+    # history spans simulated days rather than real minutes.
+    forecast.time = types.SimpleNamespace(time=lambda: clock.now().timestamp(),
+                                          localtime=time.localtime)
+    api.CREDENTIALS_PATH.write_text(json.dumps({"claudeAiOauth": {
+        "accessToken": "soak",
+        "refreshToken": "soak",
+        "expiresAt": int(time.time() * 1000) + 10 * 365 * 86400 * 1000,
+    }}), encoding="utf-8")
+
+    log.info("Soaking the %r popup renderer", renderer)
+    widget = TrackerWidget(Settings(refresh_interval=interval, popup_renderer=renderer))
+    tray = TrayManager(widget)
+    tray._icon = _FakeIcon()
+    widget.set_tray(tray)
+    widget.watchdog.start()
+
+    samples: list[dict] = []
+    started = time.perf_counter()
+    try:
+        for i in range(1, cycles + 1):
+            clock.advance(interval)
+            widget.refresh()  # stub API -> fetch_usage -> _apply_usage -> icon
+            widget.toggle_popup()  # opens on odd cycles, closes on even ones
+            if i % 500 == 0:
+                threading.Timer(0.0, tray_mod._promote_tray_icon).start()
+            _pump(widget.root)
+
+            if i > warmup and i % sample_every == 0:
+                samples.append({"cycle": i, **_sample(widget.root)})
+                log.info("cycle %d/%d %s", i, cycles, samples[-1])
+    finally:
+        widget.watchdog.stop()
+        widget._close_popup()
+        _pump(widget.root)
+        widget.root.destroy()
+        server.shutdown()
+
+    elapsed = time.perf_counter() - started
+    log.info("%d cycles in %.1fs (%.2f ms/cycle, %s simulated)",
+             cycles, elapsed, elapsed / cycles * 1000, timedelta(seconds=cycles * interval))
+    log.info("Main-thread stalls: %d, worst %.2fs",
+             widget.watchdog.stall_count, widget.watchdog.worst_stall)
+
+    if len(samples) < MIN_SAMPLES:
+        log.error("Not enough samples — raise --cycles or lower --sample-every")
+        return 2
+    leaks = _find_leaks(samples)
+    for leak in leaks:
+        log.error("Unbounded growth: %s", leak)
+    if not leaks:
+        log.info("No unbounded growth detected")
+    return 1 if leaks else 0
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=20000)
+    parser.add_argument("--sample-every", type=int, default=250)
+    parser.add_argument("--warmup", type=int, default=1000,
+                        help="cycles to run before the first sample")
+    parser.add_argument("--interval", type=int, default=60,
+                        help="simulated seconds per poll cycle")
+    parser.add_argument("--renderer", choices=("widgets", "image", "both"), default="both",
+                        help="popup renderer to soak")
+    args = parser.parse_args()
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        sys.exit("No DISPLAY — run under a virtual display, e.g. `xvfb-run -a ...`")
+
+    renderers = ("widgets", "image") if args.renderer == "both" else (args.renderer,)
+    sys.exit(max(run(args.cycles, args.sample_every, args.warmup, args.interval, renderer)
+                 for renderer in renderers))
+
+
+if __name__ == "__main__":
+    main()